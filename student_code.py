@@ -1,64 +1,129 @@
+"""SortableDigraph, TraversableDigraph (a SortableDigraph) and DAG (a TraversableDigraph)."""
+
+import sys
 from collections import deque
 
-"""TraversalDigraph, which inherits from SortableDigraph and DAG which inherits from TraversalDigraph."""
+
+def _expand_frontier(frontier, adjacency, seen, other_seen):
+    """Return the next BFS level of frontier, or None if it meets other_seen."""
+    level = []
+    push = level.append
+    visit = seen.add
+    for node in frontier:
+        for neighbor in adjacency[node]:
+            if neighbor in other_seen:
+                return None
+            if neighbor not in seen:
+                visit(neighbor)
+                push(neighbor)
+    return level
+
+
+def _intern(name):
+    """Return the interned copy of a node name; str subclasses are kept as is."""
+    try:
+        return sys.intern(name)
+    except TypeError:
+        return name
 
 
 class SortableDigraph:
-    """A directed graph with sortable and traversal functionality."""
+    """A directed graph with sortable and traversal functionality.
+
+    ``graph`` maps each node to a ``{child: edge_weight}`` dict, so edge
+    weights live with the edges; everything else only needs the keys.
+    ``_rev`` maps each node to the set of its parents.
+    """
 
     def __init__(self):
         """Initialize an empty directed graph."""
         self.graph = {}
+        self._rev = {}
 
     def add_node(self, node_name, value=None):
         """Add a node if it doesn't exist."""
         if not isinstance(node_name, str):
             raise TypeError("Node name must be a string.")
         if node_name not in self.graph:
-            self.graph[node_name] = {}
+            self._new_node(_intern(node_name))
+
+    def _new_node(self, node_name):
+        """Create the adjacency entries for a node known to be new."""
+        self.graph[node_name] = {}
+        self._rev[node_name] = set()
 
     def get_nodes(self):
-        """Return all nodes in the graph."""
-        return list(self.graph.keys())
+        """Return a live view of all nodes in the graph."""
+        return self.graph.keys()
 
     def add_edge(self, source, target, edge_weight=None):
         """Add a directed edge source → target with optional weight."""
+        self._check_edge(source, target)
         self.add_node(source)
         self.add_node(target)
-        self.graph[source][target] = edge_weight
+        children = self.graph[source]
+        if target not in children:
+            self._rev[target].add(source)
+        children[target] = edge_weight
+
+    def add_edges_from(self, edges):
+        """Add every (source, target) pair in edges.
+
+        The pairs' shape and node names are all checked before anything is
+        added. Per-edge checks such as a DAG's cycle test run as each edge
+        is inserted, so a failure there keeps the edges added before it.
+        Existing edges keep their weights; new edges get no weight.
+        """
+        edges = list(edges)
+        if not all(not isinstance(edge, str) and len(edge) == 2 for edge in edges):
+            raise TypeError("Edges must be (source, target) pairs.")
+        if not all(isinstance(node, str) for edge in edges for node in edge):
+            raise TypeError("Node name must be a string.")
+        graph, rev = self.graph, self._rev
+        new_node = self._new_node
+        check = self._check_edge
+        for source, target in edges:
+            check(source, target)
+            if source not in graph:
+                new_node(_intern(source))
+            if target not in graph:
+                new_node(_intern(target))
+            children = graph[source]
+            if target not in children:
+                children[target] = None
+                rev[target].add(source)
+
+    def _check_edge(self, source, target):
+        """Raise if source → target may not be added; called before any change."""
 
     def get_children(self, node_name):
-        """Return children of a node."""
-        return list(self.graph.get(node_name, {}).keys())
+        """Return a live view of the children of a node."""
+        return self.graph.get(node_name, {}).keys()
 
     def successors(self, node_name):
         """Return all nodes directly reachable from the given node."""
-        return sorted(list(self.graph.get(node_name, {}).keys()))
+        return sorted(self.graph.get(node_name, ()))
 
     def predecessors(self, node_name):
         """Return all nodes that have edges leading to the given node."""
-        return sorted(
-            [src for src, neighbors in self.graph.items() if node_name in neighbors]
-        )
+        return sorted(self._rev.get(node_name, ()))
 
     def top_sort(self):
-        """Perform topological sorting of the graph."""
-        in_degree = {u: 0 for u in self.graph}
-        for _, neighbors in self.graph.items():
-            for vertex in neighbors:
-                in_degree[vertex] += 1
-
-        queue = [u for u in self.graph if in_degree[u] == 0]
+        """Perform topological sorting of the graph (Kahn's algorithm)."""
+        graph = self.graph
+        in_degree = {node: len(parents) for node, parents in self._rev.items()}
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
         sorted_nodes = []
+        append = sorted_nodes.append
 
         while queue:
-            node = queue.pop()
-            sorted_nodes.append(node)
-            for neighbor in self.graph[node]:
+            node = queue.popleft()
+            append(node)
+            for neighbor in graph[node]:
                 in_degree[neighbor] -= 1
                 if in_degree[neighbor] == 0:
                     queue.append(neighbor)
-        if len(sorted_nodes) != len(self.graph):
+        if len(sorted_nodes) != len(graph):
             raise ValueError("Graph contains a cycle or disconnected components.")
         return sorted_nodes
 
@@ -71,60 +136,70 @@ class TraversableDigraph(SortableDigraph):
     """A digraph that supports traversal algorithms."""
 
     def dfs(self, start):
-        """Depth-First Search traversal."""
+        """Depth-First Search traversal, expanded lazily as nodes are consumed."""
         graph = self.graph
-        visited = set([start])
-        stack = sorted(graph[start].keys(), reverse=True)
+        visited = {start}
+        visit = visited.add
+        stack = sorted(graph[start], reverse=True)
+        pop = stack.pop
+        extend = stack.extend
 
         while stack:
-            node = stack.pop()
+            node = pop()
             if node in visited:
                 continue
-            visited.add(node)
+            visit(node)
             yield node
-            for neighbor in sorted(graph[node].keys(), reverse=True):
-                stack.append(neighbor)
+            extend(sorted(graph[node], reverse=True))
 
     def bfs(self, start):
-        """Breadth-First Search traversal using deque."""
-        visited = set([start])
-        queue = deque(self.graph[start].keys())
+        """Breadth-First Search traversal, expanded lazily as nodes are consumed."""
         graph = self.graph
+        visited = {start}
+        visit = visited.add
+        queue = deque((start,))
+        popleft = queue.popleft
+        enqueue = queue.append
 
         while queue:
-            node = queue.popleft()
-            if node in visited:
-                continue
-            visited.add(node)
-            yield node
-            for neighbor in sorted(graph[node].keys()):
-                queue.append(neighbor)
+            for neighbor in sorted(graph[popleft()]):
+                if neighbor not in visited:
+                    visit(neighbor)
+                    enqueue(neighbor)
+                    yield neighbor
+
+    def path_exists(self, start_node, target_node):
+        """Check if there is a path from start_node to target_node.
+
+        Runs a bidirectional BFS: forward from start_node over the children
+        and backward from target_node over the parents, always growing the
+        smaller frontier, until the two searches meet or one runs dry.
+        Work is proportional to the nodes explored, not to the graph size.
+        """
+        graph = self.graph
+        if start_node not in graph or target_node not in graph:
+            return False
+        if start_node == target_node:
+            return True
+
+        forward, backward = [start_node], [target_node]
+        forward_seen, backward_seen = {start_node}, {target_node}
+        while forward and backward:
+            if len(forward) <= len(backward):
+                forward = _expand_frontier(forward, graph, forward_seen, backward_seen)
+            else:
+                backward = _expand_frontier(backward, self._rev, backward_seen, forward_seen)
+            if forward is None or backward is None:
+                return True
+        return False
 
 
 class DAG(TraversableDigraph):
     """A Directed Acyclic Graph that prevents cycle creation."""
 
-    def add_edge(self, source, target, edge_weight=None):
-        """Add edge source → target only if it doesn’t create a cycle."""
-        if self.path_exists(target, source):
+    def _check_edge(self, source, target):
+        """Refuse edge source → target if it would create a cycle."""
+        if source == target or self.path_exists(target, source):
             raise ValueError(
                 f"Adding edge {source} → {target} would create a cycle."
             )
-        super().add_edge(source, target, edge_weight=edge_weight)
-
-    def path_exists(self, start_node, target_node):
-        """Check if there is a path from start_node to target_node using DFS."""
-        if start_node not in self.graph:
-            return False
-
-        visited = set()
-        stack = [start_node]
-
-        while stack:
-            node = stack.pop()
-            if node == target_node:
-                return True
-            if node not in visited:
-                visited.add(node)
-                stack.extend(self.graph.get(node, {}).keys())
-        return False
@@ -0,0 +1,50 @@
+import pytest
+
+from student_code import DAG, TraversableDigraph
+
+
+def test_add_edges_from_matches_add_edge():
+    bulk = TraversableDigraph()
+    bulk.add_edges_from([("A", "B"), ("A", "C"), ("B", "C")])
+    single = TraversableDigraph()
+    for source, target in [("A", "B"), ("A", "C"), ("B", "C")]:
+        single.add_edge(source, target)
+
+    assert bulk.graph == single.graph
+    assert bulk.predecessors("C") == ["A", "B"]
+    assert list(bulk.bfs("A")) == ["B", "C"]
+
+
+def test_add_edges_from_accepts_any_pair_sequence():
+    graph = TraversableDigraph()
+    graph.add_edges_from([["A", "B"], ("B", "C")])
+    assert graph.successors("A") == ["B"]
+    assert graph.successors("B") == ["C"]
+
+
+def test_add_edges_from_keeps_existing_weights():
+    graph = TraversableDigraph()
+    graph.add_edge("A", "B", edge_weight=5)
+    graph.add_edges_from([("A", "B"), ("B", "C")])
+    assert graph.graph == {"A": {"B": 5}, "B": {"C": None}, "C": {}}
+
+
+@pytest.mark.parametrize("edges", [
+    [("A", "B"), ("B", "C", 1)],
+    [("A", "B"), "BC"],
+    [("A", "B"), ("B", 1)],
+])
+def test_add_edges_from_rejects_bad_input_before_mutating(edges):
+    graph = TraversableDigraph()
+    with pytest.raises(TypeError):
+        graph.add_edges_from(edges)
+    assert graph.graph == {}
+
+
+def test_dag_add_edges_from_detects_cycles():
+    graph = DAG()
+    graph.add_edges_from([("A", "B"), ("B", "C")])
+    with pytest.raises(ValueError):
+        graph.add_edges_from([("C", "D"), ("D", "A"), ("D", "E")])
+    # Cycle checks run per edge: C → D went in before D → A was refused.
+    assert graph.top_sort() == ["A", "B", "C", "D"]
@@ -0,0 +1,49 @@
+import copy
+
+import pytest
+
+from student_code import DAG
+
+
+def test_self_loop_on_new_node_is_rejected():
+    graph = DAG()
+    with pytest.raises(ValueError):
+        graph.add_edge("A", "A")
+    assert graph.graph == {}
+
+
+def test_self_loop_on_existing_node_is_rejected():
+    graph = DAG()
+    graph.add_edge("A", "B")
+    with pytest.raises(ValueError):
+        graph.add_edge("B", "B")
+
+
+def test_long_chain_rejects_closing_edge():
+    graph = DAG()
+    for i in range(500):
+        graph.add_edge(f"n{i}", f"n{i + 1}")
+    with pytest.raises(ValueError):
+        graph.add_edge("n500", "n0")
+    graph.add_edge("n0", "n500")
+    assert graph.path_exists("n0", "n500")
+    assert not graph.path_exists("n500", "n0")
+
+
+@pytest.mark.parametrize("source, target", [
+    ("C", "A"),  # both endpoints exist
+    ("D", "D"),  # self-loop on a node that does not exist yet
+])
+def test_rejected_edge_leaves_graph_unchanged(source, target):
+    graph = DAG()
+    graph.add_edge("A", "B")
+    graph.add_edge("B", "C")
+    expected_graph = copy.deepcopy(graph.graph)
+    expected_rev = copy.deepcopy(graph._rev)
+    with pytest.raises(ValueError):
+        graph.add_edge(source, target)
+    with pytest.raises(ValueError):
+        graph.add_edges_from([(source, target)])
+    assert graph.graph == expected_graph
+    assert graph._rev == expected_rev
+    assert graph.top_sort() == ["A", "B", "C"]
@@ -0,0 +1,21 @@
+from student_code import TraversableDigraph
+
+
+def test_dfs_follows_later_edges_to_shared_children():
+    graph = TraversableDigraph()
+    graph.add_edge("A", "B")
+    graph.add_edge("A", "D")
+    graph.add_edge("B", "C")
+    graph.add_edge("C", "D")
+    graph.add_edge("B", "E")
+
+    # D is a child of A, but depth-first order reaches it through B → C first.
+    assert list(graph.dfs("A")) == ["B", "C", "D", "E"]
+
+
+def test_dfs_yields_each_node_once():
+    graph = TraversableDigraph()
+    for source, target in [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")]:
+        graph.add_edge(source, target)
+
+    assert list(graph.dfs("A")) == ["B", "D", "C"]
@@ -0,0 +1,14 @@
+from student_code import DAG
+
+
+class Label(str):
+    pass
+
+
+def test_str_subclass_names_are_accepted():
+    graph = DAG()
+    graph.add_node(Label("A"))
+    graph.add_edge(Label("A"), Label("B"))
+    graph.add_edges_from([(Label("B"), Label("C"))])
+    assert graph.top_sort() == ["A", "B", "C"]
+    assert list(graph.dfs("A")) == ["B", "C"]
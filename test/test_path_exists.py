@@ -0,0 +1,47 @@
+from student_code import TraversableDigraph
+
+
+def build_graph(edges):
+    graph = TraversableDigraph()
+    for source, target in edges:
+        graph.add_edge(source, target)
+    return graph
+
+
+def test_path_exists_when_searches_meet():
+    graph = build_graph([("A", "B"), ("B", "C"), ("C", "D"), ("D", "E")])
+    assert graph.path_exists("A", "E")
+    assert graph.path_exists("B", "D")
+    assert graph.path_exists("A", "B")
+
+
+def test_path_exists_expands_the_smaller_side():
+    # A fans out widely, E has a single parent: the backward side grows first.
+    edges = [("A", child) for child in "BCDFG"] + [("B", "X"), ("X", "E")]
+    graph = build_graph(edges)
+    assert graph.path_exists("A", "E")
+    assert not graph.path_exists("E", "A")
+
+
+def test_path_exists_without_path():
+    graph = build_graph([("A", "B"), ("C", "D"), ("D", "B")])
+    assert not graph.path_exists("A", "C")
+    assert not graph.path_exists("B", "A")
+    assert not graph.path_exists("A", "D")
+
+
+def test_path_exists_from_node_to_itself():
+    graph = build_graph([("A", "B")])
+    assert graph.path_exists("A", "A")
+    assert graph.path_exists("B", "B")
+
+
+def test_path_exists_with_unknown_nodes():
+    graph = build_graph([("A", "B")])
+    assert not graph.path_exists("A", "Z")
+    assert not graph.path_exists("Z", "A")
+
+
+def test_path_exists_follows_cycles():
+    graph = build_graph([("A", "B"), ("B", "C"), ("C", "A")])
+    assert graph.path_exists("C", "B")
@@ -0,0 +1,22 @@
+from student_code import DAG
+
+
+def test_top_sort_sees_edits_between_calls():
+    graph = DAG()
+    graph.add_edge("A", "B")
+    assert graph.top_sort() == ["A", "B"]
+
+    graph.add_edge("C", "A")
+    assert graph.top_sort() == ["C", "A", "B"]
+
+    graph.add_node("D")
+    assert graph.top_sort() == ["C", "D", "A", "B"]
+
+
+def test_weight_update_keeps_structure():
+    graph = DAG()
+    graph.add_edge("A", "B", edge_weight=1)
+    graph.add_edge("A", "B", edge_weight=2)
+    assert graph.graph["A"]["B"] == 2
+    assert graph.predecessors("B") == ["A"]
+    assert graph.top_sort() == ["A", "B"]